@@ -10,5 +10,19 @@ if (!process.env.DATABASE_URL) {
   );
 }
 
-export const pool = new Pool({ connectionString: process.env.DATABASE_URL });
+export const pool = new Pool({
+  connectionString: process.env.DATABASE_URL,
+  max: Number(process.env.PG_POOL_MAX || "10"),
+  idleTimeoutMillis: 30_000,
+  connectionTimeoutMillis: 5_000,
+  // Recycle connections so server-side idle kills don't hand us dead sockets
+  maxLifetimeSeconds: 1800,
+  keepAlive: true,
+});
+
+// An idle client losing its connection is evicted by the pool; don't crash on it
+pool.on("error", (err) => {
+  console.error("Postgres pool error:", err);
+});
+
 export const db = drizzle(pool, { schema });
@@ -25,13 +25,15 @@ app.use(
 
 app.use(express.urlencoded({ extended: false }));
 
+const timeFormatter = new Intl.DateTimeFormat("en-US", {
+  hour: "numeric",
+  minute: "2-digit",
+  second: "2-digit",
+  hour12: true,
+});
+
 export function log(message: string, source = "express") {
-  const formattedTime = new Date().toLocaleTimeString("en-US", {
-    hour: "numeric",
-    minute: "2-digit",
-    second: "2-digit",
-    hour12: true,
-  });
+  const formattedTime = timeFormatter.format(new Date());
 
   console.log(`${formattedTime} [${source}] ${message}`);
 }
@@ -1,4 +1,4 @@
-import { pgTable, text, serial, integer, boolean, timestamp, jsonb, real } from "drizzle-orm/pg-core";
+import { pgTable, text, serial, integer, boolean, timestamp, jsonb, real, index } from "drizzle-orm/pg-core";
 import { createInsertSchema } from "drizzle-zod";
 import { z } from "zod";
 
@@ -14,7 +14,10 @@ export const scenarios = pgTable("scenarios", {
   rawRequest: jsonb("raw_request").notNull(), // Store the full request details
   rawResponse: jsonb("raw_response").notNull(), // Store the calculated quote
   createdAt: timestamp("created_at").defaultNow(),
-});
+}, (table) => [
+  // getScenarios orders by created_at desc with a limit
+  index("scenarios_created_at_idx").on(table.createdAt),
+]);
 
 // === SCHEMAS ===
 